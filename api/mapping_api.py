@@ -8,6 +8,8 @@ Endpoints FastAPI pour la gestion du mapping normatif IEC 61850.
 
 from pathlib import Path
 from typing import Any
+import json
+import shutil
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
@@ -29,7 +31,6 @@ async def get_mapping() -> dict[str, Any]:
     if not mapping_file.exists():
         raise HTTPException(status_code=404, detail="Mapping non trouvé")
 
-    import json
     with open(mapping_file, "r", encoding="utf-8") as f:
         mapping = json.load(f)
 
@@ -53,7 +54,6 @@ async def get_types() -> dict[str, Any]:
     if not mapping_file.exists():
         raise HTTPException(status_code=404, detail="Mapping non trouvé")
 
-    import json
     with open(mapping_file, "r", encoding="utf-8") as f:
         mapping = json.load(f)
 
@@ -70,7 +70,6 @@ async def get_enum_types() -> dict[str, Any]:
     if not mapping_file.exists():
         raise HTTPException(status_code=404, detail="Mapping non trouvé")
 
-    import json
     with open(mapping_file, "r", encoding="utf-8") as f:
         mapping = json.load(f)
 
@@ -87,7 +86,6 @@ async def get_cdc() -> dict[str, Any]:
     if not mapping_file.exists():
         raise HTTPException(status_code=404, detail="Mapping non trouvé")
 
-    import json
     with open(mapping_file, "r", encoding="utf-8") as f:
         mapping = json.load(f)
 
@@ -104,7 +102,6 @@ async def get_cdc_details(cdc_name: str) -> dict[str, Any]:
     if not mapping_file.exists():
         raise HTTPException(status_code=404, detail="Mapping non trouvé")
 
-    import json
     with open(mapping_file, "r", encoding="utf-8") as f:
         mapping = json.load(f)
 
@@ -125,7 +122,6 @@ async def get_da_info(da_name: str) -> dict[str, Any]:
     if not mapping_file.exists():
         raise HTTPException(status_code=404, detail="Mapping non trouvé")
 
-    import json
     with open(mapping_file, "r", encoding="utf-8") as f:
         mapping = json.load(f)
 
@@ -177,7 +173,6 @@ async def merge_mapping() -> dict[str, Any]:
         merged, output_path = merger.run()
 
         # Copier comme mapping principal
-        import shutil
         main_mapping = MAPPING_DIR / "mapping_type.json"
         shutil.copy(output_path, main_mapping)
 
@@ -213,7 +208,6 @@ async def get_enum_values(enum_name: str) -> dict[str, Any]:
     if not mapping_file.exists():
         raise HTTPException(status_code=404, detail="Mapping non trouvé")
 
-    import json
     with open(mapping_file, "r", encoding="utf-8") as f:
         mapping = json.load(f)
 
@@ -240,7 +234,6 @@ async def search_mapping(query: str) -> dict[str, Any]:
     if not mapping_file.exists():
         raise HTTPException(status_code=404, detail="Mapping non trouvé")
 
-    import json
     with open(mapping_file, "r", encoding="utf-8") as f:
         mapping = json.load(f)
 
@@ -7,6 +7,7 @@ pour obtenir un mapping complet et à jour.
 """
 
 import json
+import re
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
@@ -81,7 +82,6 @@ class MappingMerger:
 
     def _normalize_enum_name(self, enum_id: str) -> str:
         """Normalise le nom d'un EnumType (enlève suffixes numériques)."""
-        import re
         # Enlever les suffixes comme "123", "12", "1" à la fin
         normalized = re.sub(r'\d+$', '', enum_id)
         return normalized or enum_id
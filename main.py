@@ -5,6 +5,8 @@ Lance le serveur R#BD avec :
 - Fichiers statiques (HTML/CSS/JS)
 """
 
+import logging
+import os
 import sys
 from pathlib import Path
 
@@ -12,23 +14,37 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 
 from api.icd_api import router as icd_router
 from api.isa_api import router as isa_router
 from api.mapping_api import router as mapping_router
 
 # Configuration
-BASE_DIR = Path(__file__).parent
+BASE_DIR = Path(__file__).resolve().parent
 WEB_DIR = BASE_DIR / "web"
 DATA_DIR = BASE_DIR / "data"
 UPLOADS_DIR = BASE_DIR / "uploads"
+ASSETS_DIR = BASE_DIR / "assets"
 
 WEB_PORT = 8554
 API_PORT = 8654
 
+# Rechargement auto (développement uniquement) : RBD_RELOAD=1
+RELOAD = os.getenv("RBD_RELOAD", "0") == "1"
+
+# Configuré à l'import : le sous-processus du mode reload n'exécute pas main()
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger("rbd")
+
+
+def _ensure_dir(path: Path) -> str:
+    """Crée le répertoire si besoin et retourne son chemin pour StaticFiles."""
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
+
+
 # Application FastAPI
 app = FastAPI(
     title="R#BD - Base de données R#SPACE",
@@ -42,16 +58,19 @@ app.include_router(isa_router)
 app.include_router(mapping_router)
 
 # Servir les fichiers statiques
-app.mount("/web", StaticFiles(directory=str(WEB_DIR)), name="web")
-app.mount("/data", StaticFiles(directory=str(DATA_DIR)), name="data")
-app.mount("/uploads", StaticFiles(directory=str(UPLOADS_DIR)), name="uploads")
-app.mount("/assets", StaticFiles(directory=str(BASE_DIR / "assets")), name="assets")
+app.mount("/web", StaticFiles(directory=_ensure_dir(WEB_DIR)), name="web")
+app.mount("/data", StaticFiles(directory=_ensure_dir(DATA_DIR)), name="data")
+app.mount("/uploads", StaticFiles(directory=_ensure_dir(UPLOADS_DIR)), name="uploads")
+app.mount("/assets", StaticFiles(directory=_ensure_dir(ASSETS_DIR)), name="assets")
+
+# Page d'accueil servie via StaticFiles (ETag / 304) sans monter la racine du projet
+index_files = StaticFiles(directory=str(BASE_DIR), html=True)
 
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Redirige vers la page d'accueil."""
-    return FileResponse(str(BASE_DIR / "index.html"))
+    return await index_files.get_response("index.html", request.scope)
 
 
 @app.get("/health")
@@ -62,13 +81,14 @@ async def health():
 
 def main():
     """Lance le serveur."""
-    print(f"🚀 R#BD démarré sur http://localhost:{WEB_PORT}")
-    print(f"📚 API disponible sur http://localhost:{WEB_PORT}/docs")
+    logger.info("🚀 R#BD démarré sur http://localhost:%s", WEB_PORT)
+    logger.info("📚 API disponible sur http://localhost:%s/docs", WEB_PORT)
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=WEB_PORT,
-        reload=True
+        reload=RELOAD,
+        log_config=None
     )
 
 